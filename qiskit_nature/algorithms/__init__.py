@@ -108,12 +108,8 @@ of various potentials. More detail may be found in the sub-module linked below
 
 """
 
-from .excited_states_solvers import (ExcitedStatesEigensolver, ExcitedStatesSolver, QEOM,
-                                     EigensolverFactory, NumPyEigensolverFactory)
-from .ground_state_solvers import (AdaptVQE, GroundStateEigensolver, GroundStateSolver,
-                                   MinimumEigensolverFactory, NumPyMinimumEigensolverFactory,
-                                   VQEUCCFactory, VQEUVCCFactory)
-from .pes_samplers import BOPESSampler
+import importlib
+import sys
 
 __all__ = [
     'ExcitedStatesEigensolver',
@@ -130,3 +126,47 @@ __all__ = [
     'VQEUVCCFactory',
     'BOPESSampler',
 ]
+
+# The solvers are resolved lazily (PEP 562): each of them pulls in heavy transitive dependencies
+# (scipy, qiskit.opflow, driver wrappers), so importing all of them eagerly penalizes every
+# downstream tool which only needs a single solver class.
+_lazy_imports = {
+    'ExcitedStatesEigensolver': 'excited_states_solvers',
+    'ExcitedStatesSolver': 'excited_states_solvers',
+    'QEOM': 'excited_states_solvers',
+    'EigensolverFactory': 'excited_states_solvers',
+    'NumPyEigensolverFactory': 'excited_states_solvers',
+    'AdaptVQE': 'ground_state_solvers',
+    'GroundStateEigensolver': 'ground_state_solvers',
+    'GroundStateSolver': 'ground_state_solvers',
+    'MinimumEigensolverFactory': 'ground_state_solvers',
+    'NumPyMinimumEigensolverFactory': 'ground_state_solvers',
+    'VQEUCCFactory': 'ground_state_solvers',
+    'VQEUVCCFactory': 'ground_state_solvers',
+    'BOPESSampler': 'pes_samplers',
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        submodule = importlib.import_module('.' + _lazy_imports[name], __name__)
+        attribute = getattr(submodule, name)
+        # cache the attribute in the module namespace so this hook only runs once per name
+        globals()[name] = attribute
+        return attribute
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ requires Python 3.7, so older interpreters fall back to the
+    # eager imports
+    from .excited_states_solvers import (ExcitedStatesEigensolver, ExcitedStatesSolver, QEOM,
+                                         EigensolverFactory, NumPyEigensolverFactory)
+    from .ground_state_solvers import (AdaptVQE, GroundStateEigensolver, GroundStateSolver,
+                                       MinimumEigensolverFactory, NumPyMinimumEigensolverFactory,
+                                       VQEUCCFactory, VQEUVCCFactory)
+    from .pes_samplers import BOPESSampler
@@ -78,6 +78,7 @@ class VQEUCCFactory(MinimumEigensolverFactory):
         self.include_custom = include_custom
         self.ansatz = ansatz
         self.initial_state = initial_state
+        self._default_ansatz: Optional[UCCSD] = None
         self._vqe = VQE(ansatz=None,
                         quantum_instance=self._quantum_instance,
                         optimizer=self._optimizer,
@@ -193,7 +194,13 @@ class VQEUCCFactory(MinimumEigensolverFactory):
 
         ansatz = self.ansatz
         if ansatz is None:
-            ansatz = UCCSD()
+            # The default Ansatz instance is shared across repeated `get_solver` calls. In
+            # combination with the setters below ignoring unchanged values, this preserves the
+            # already constructed circuit across e.g. the geometry points of a BOPES sampling,
+            # where only the Hamiltonian integrals vary.
+            if self._default_ansatz is None:
+                self._default_ansatz = UCCSD(lazy=True)
+            ansatz = self._default_ansatz
         ansatz.qubit_converter = qubit_converter
         ansatz.num_particles = num_particles
         ansatz.num_spin_orbitals = num_spin_orbitals
@@ -39,6 +39,7 @@ Ansatzes
    UCCSD
    PUCCD
    SUCCD
+   UpCCGSD
    CHC
    UVCC
    UVCCSD
@@ -51,6 +52,7 @@ from .ansatzes import (
     UCCSD,
     PUCCD,
     SUCCD,
+    UpCCGSD,
     CHC,
     UVCC,
     UVCCSD,
@@ -67,6 +69,7 @@ __all__ = [
     'UCCSD',
     'PUCCD',
     'SUCCD',
+    'UpCCGSD',
     'HartreeFock',
     'CHC',
     'UVCC',
@@ -28,6 +28,7 @@ Electronic Structure Ansatzes
    UCCSD
    PUCCD
    SUCCD
+   UpCCGSD
 
 
 Vibrational Structure Ansatzes
@@ -49,6 +50,7 @@ from .puccd import PUCCD
 from .succd import SUCCD
 from .ucc import UCC
 from .uccsd import UCCSD
+from .upccgsd import UpCCGSD
 from .uvcc import UVCC
 from .uvccsd import UVCCSD
 
@@ -59,6 +61,7 @@ __all__ = [
     'SUCCD',
     'UCC',
     'UCCSD',
+    'UpCCGSD',
     'UVCC',
     'UVCCSD',
 ]
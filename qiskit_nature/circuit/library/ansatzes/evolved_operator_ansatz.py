@@ -12,15 +12,21 @@
 
 """The evolved operator ansatz."""
 
-from typing import List, Union, Optional
+from typing import Dict, List, Sequence, Tuple, Union, Optional
 
 import numpy as np
 
-from qiskit.circuit import Parameter, ParameterVector, QuantumRegister, QuantumCircuit
+from qiskit.circuit import (Instruction, Parameter, ParameterExpression, ParameterVector,
+                            QuantumRegister, QuantumCircuit)
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.circuit.library import BlueprintCircuit
 from qiskit.opflow import OperatorBase, EvolutionBase, PauliTrotterEvolution
 
+# The precomputed data of :meth:`EvolvedOperatorAnsatz.assign_parameters_flat`: the linear
+# dependency of every parameterized gate slot, the linear terms of the global phase and the
+# constant part of the global phase.
+_FlatBindMap = Tuple[List[Tuple[int, int, int, float, float]], List[Tuple[int, float]], float]
+
 
 class EvolvedOperatorAnsatz(BlueprintCircuit):
     """The evolved operator ansatz."""
@@ -51,10 +57,17 @@ class EvolvedOperatorAnsatz(BlueprintCircuit):
         self._reps = reps
         self._insert_barriers = insert_barriers
         self._initial_state = initial_state
+        self._flat_bind_map: Optional[_FlatBindMap] = None
+        self._flat_bind_unsupported = False
 
         # use setter to set operators
         self.operators = operators
 
+    def _invalidate(self):
+        self._flat_bind_map = None
+        self._flat_bind_unsupported = False
+        super()._invalidate()
+
     def _check_configuration(self, raise_on_failure: bool = True) -> bool:
         if self.operators is None:
             if raise_on_failure:
@@ -98,6 +111,10 @@ class EvolvedOperatorAnsatz(BlueprintCircuit):
     @initial_state.setter
     def initial_state(self, initial_state: QuantumCircuit) -> None:
         """Sets the initial state."""
+        # `QuantumCircuit.__eq__` compares the circuits by value, so an equivalent circuit (e.g.
+        # a freshly constructed but unchanged Hartree-Fock state) does not invalidate the Ansatz.
+        if initial_state is self._initial_state or initial_state == self._initial_state:
+            return
         self._invalidate()
         self._initial_state = initial_state
 
@@ -150,6 +167,152 @@ class EvolvedOperatorAnsatz(BlueprintCircuit):
             self._build()
             return np.zeros(self.reps * len(self.operators), dtype=float)
 
+    # Gate types whose definitions are regenerated from their params on demand, which makes them
+    # safe for the in-place numeric substitution performed by :meth:`assign_parameters_flat`.
+    _FLAT_BIND_GATES = ('RZGate', 'RXGate', 'RYGate', 'PhaseGate', 'U1Gate')
+
+    def _extract_phase_terms(self, parameter_positions: Dict[Parameter, int]
+                             ) -> Optional[Tuple[List[Tuple[int, float]], float]]:
+        """Extracts the linear parameter dependency of the global phase.
+
+        Args:
+            parameter_positions: the mapping from each circuit parameter to its position in the
+                parameter iteration order.
+
+        Returns:
+            The linear ``(parameter_position, coeff)`` terms and the constant part of the global
+            phase, or ``None`` when the phase is not linear in its parameters.
+        """
+        global_phase = self.global_phase
+        if not isinstance(global_phase, ParameterExpression) or not global_phase.parameters:
+            return [], float(global_phase)
+
+        phase_terms: List[Tuple[int, float]] = []
+        phase_parameters = list(global_phase.parameters)
+        try:
+            phase_offset = float(global_phase.bind({p: 0.0 for p in phase_parameters}))
+            for parameter in phase_parameters:
+                probe_values = {p: 0.0 for p in phase_parameters}
+                probe_values[parameter] = 1.0
+                coeff = float(global_phase.bind(probe_values)) - phase_offset
+                if coeff != 0.0:
+                    phase_terms.append((parameter_positions[parameter], coeff))
+            check = float(global_phase.bind({p: 2.0 for p in phase_parameters}))
+        except TypeError:
+            return None
+
+        total_coeff = sum(coeff for _, coeff in phase_terms)
+        if abs(check - (2.0 * total_coeff + phase_offset)) > 1e-12:
+            # the global phase is not linear in its parameters
+            return None
+
+        return phase_terms, phase_offset
+
+    def _build_flat_bind_map(self) -> Optional[_FlatBindMap]:
+        """Extracts the linear parameter dependency of every parameterized gate slot.
+
+        Every gate entry maps one parameterized slot of the circuit data to the tuple
+        ``(data_index, slot, parameter_position, coeff, offset)`` such that binding the
+        parameters to ``values`` must set the slot to ``coeff * values[parameter_position] +
+        offset``. A parameterized global phase is extracted in the same fashion, into its linear
+        ``(parameter_position, coeff)`` terms and its constant part. Returns ``None`` when the
+        circuit contains any construct for which this numeric substitution would not be faithful,
+        in which case the caller falls back to the generic parameter assignment.
+        """
+        parameter_positions = {param: index for index, param in enumerate(self.parameters)}
+
+        phase = self._extract_phase_terms(parameter_positions)
+        if phase is None:
+            return None
+        phase_terms, phase_offset = phase
+
+        bind_map: List[Tuple[int, int, int, float, float]] = []
+        for data_index, (instruction, _, _) in enumerate(self._data):
+            for slot, expression in enumerate(instruction.params):
+                if not isinstance(expression, ParameterExpression) \
+                        or not expression.parameters:
+                    continue
+                if type(instruction).__name__ not in self._FLAT_BIND_GATES:
+                    return None
+                if len(expression.parameters) != 1:
+                    return None
+                parameter = next(iter(expression.parameters))
+                try:
+                    offset = float(expression.bind({parameter: 0.0}))
+                    coeff = float(expression.bind({parameter: 1.0})) - offset
+                    probe = float(expression.bind({parameter: 2.0}))
+                except TypeError:
+                    return None
+                if abs(probe - (2.0 * coeff + offset)) > 1e-12:
+                    # the expression is not linear in its parameter
+                    return None
+                bind_map.append((data_index, slot, parameter_positions[parameter],
+                                 coeff, offset))
+
+        return bind_map, phase_terms, phase_offset
+
+    def assign_parameters_flat(self, values: Sequence[float]) -> QuantumCircuit:
+        """Binds a flat array of parameter values into a plain, fully bound `QuantumCircuit`.
+
+        This is a fast alternative to :meth:`assign_parameters` for tight variational loops. The
+        values are matched against :attr:`parameters` in iteration order (the same order in which
+        e.g. the VQE zips its parameter values). On first use, the linear dependency of every
+        parameterized gate slot on its parameter is extracted once; every subsequent call then
+        only copies the parameterized gates and writes the precomputed numeric values into them,
+        bypassing the expression machinery entirely. If the circuit contains any construct for
+        which this substitution would not be faithful, the call transparently falls back to the
+        generic :meth:`assign_parameters`.
+
+        Args:
+            values: the parameter values as a sequence of floats.
+
+        Returns:
+            The bound circuit.
+
+        Raises:
+            ValueError: if the number of values does not match the number of parameters.
+        """
+        if self._data is None:
+            self._build()
+
+        parameters = list(self.parameters)
+        if len(values) != len(parameters):
+            raise ValueError('Expected {} parameter values but received {}.'.format(
+                len(parameters), len(values)))
+
+        if self._flat_bind_map is None and not self._flat_bind_unsupported:
+            self._flat_bind_map = self._build_flat_bind_map()
+            # remember when the fast path is not applicable, so the extraction does not run
+            # again on every call
+            self._flat_bind_unsupported = self._flat_bind_map is None
+
+        if self._flat_bind_map is None:
+            return self.assign_parameters(dict(zip(parameters, values)))
+
+        bind_map, phase_terms, phase_offset = self._flat_bind_map
+
+        bound = QuantumCircuit(*self.qregs, name=self.name)
+        global_phase = phase_offset
+        for position, coeff in phase_terms:
+            global_phase += coeff * float(values[position])
+        bound.global_phase = global_phase
+
+        data = list(self._data)
+        copied: Dict[int, Instruction] = {}
+        for data_index, slot, position, coeff, offset in bind_map:
+            entry = copied.get(data_index)
+            if entry is None:
+                instruction, qargs, cargs = data[data_index]
+                entry = instruction.copy()
+                # force the definition to be regenerated from the substituted params
+                entry._definition = None  # pylint: disable=protected-access
+                copied[data_index] = entry
+                data[data_index] = (entry, qargs, cargs)
+            entry.params[slot] = coeff * float(values[position]) + offset
+
+        bound._data = data  # pylint: disable=protected-access
+        return bound
+
     def _build(self):
         if self._data is not None:
             return
@@ -187,3 +350,19 @@ class EvolvedOperatorAnsatz(BlueprintCircuit):
 
         if self._initial_state:
             self.compose(self._initial_state, front=True, inplace=True)
+
+        # The Trotterized evolutions can leave a parameterized global phase behind in which every
+        # parameter carries a zero coefficient. We normalize such a constant-valued phase to its
+        # plain numeric value so that freshly built circuits compare equal to otherwise identical
+        # circuits without one (e.g. instances composed from a cached circuit template).
+        global_phase = self.global_phase
+        if isinstance(global_phase, ParameterExpression) and global_phase.parameters:
+            try:
+                lower = float(global_phase.bind({p: 0.0 for p in global_phase.parameters}))
+                upper = float(global_phase.bind({p: 1.0 for p in global_phase.parameters}))
+            except TypeError:
+                pass
+            else:
+                # the phase is linear in its parameters, so two probes detect constancy
+                if lower == upper:
+                    self.global_phase = lower
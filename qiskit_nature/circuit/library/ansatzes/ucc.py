@@ -148,6 +148,8 @@ class UCC(EvolvedOperatorAnsatz):
             initial_state: A `QuantumCircuit` object to prepend to the circuit.
         """
         self._qubit_converter = qubit_converter
+        self._qubit_converter_state = None if qubit_converter is None \
+            else qubit_converter._state_key()  # pylint: disable=protected-access
         self._num_particles = num_particles
         self._num_spin_orbitals = num_spin_orbitals
         self._excitations = excitations
@@ -170,8 +172,22 @@ class UCC(EvolvedOperatorAnsatz):
     @qubit_converter.setter
     def qubit_converter(self, conv: QubitConverter) -> None:
         """Sets the qubit operator converter."""
+        # Re-assigning a converter whose conversion-relevant state is unchanged must not
+        # invalidate the circuit. This matters for workflows like the BOPES sampling which
+        # reconfigure the Ansatz at every geometry point even though only the Hamiltonian
+        # integrals change along the surface. The comparison is based on the converter state
+        # rather than the instance identity, because `QubitConverter.convert` mutates its
+        # instance in place (e.g. when a Z2 symmetry sector is detected under an 'auto'
+        # reduction), in which case the previously converted operators are stale and must be
+        # dropped alongside the circuit.
+        state = None if conv is None else conv._state_key()  # pylint: disable=protected-access
+        if conv is not None and state == self._qubit_converter_state:
+            self._qubit_converter = conv
+            return
         self._invalidate()
+        self._operators = None
         self._qubit_converter = conv
+        self._qubit_converter_state = state
 
     @property
     def num_spin_orbitals(self) -> int:
@@ -181,6 +197,8 @@ class UCC(EvolvedOperatorAnsatz):
     @num_spin_orbitals.setter
     def num_spin_orbitals(self, n: int) -> None:
         """Sets the number of spin orbitals."""
+        if n == self._num_spin_orbitals:
+            return
         self._invalidate()
         self._num_spin_orbitals = n
 
@@ -192,6 +210,8 @@ class UCC(EvolvedOperatorAnsatz):
     @num_particles.setter
     def num_particles(self, n: Tuple[int, int]) -> None:
         """Sets the number of particles."""
+        if n == self._num_particles:
+            return
         self._invalidate()
         self._num_particles = n
 
@@ -203,6 +223,8 @@ class UCC(EvolvedOperatorAnsatz):
     @excitations.setter
     def excitations(self, exc: Union[str, int, List[int], Callable]) -> None:
         """Sets the excitations."""
+        if exc == self._excitations:
+            return
         self._invalidate()
         self._excitations = exc
 
@@ -242,8 +264,6 @@ class UCC(EvolvedOperatorAnsatz):
             # them from the `SecondQuantizedOp`s produced by the generators, if they are not already
             # present. This behavior also enables the adaptive usage of the `UCC` class by
             # algorithms such as `AdaptVQE`.
-            excitation_ops = self.excitation_ops()
-
             logger.debug('Converting SecondQuantizedOps into PauliSumOps...')
             # Convert operators according to saved state in converter from the conversion of the
             # main operator since these need to be compatible. If Z2 Symmetry tapering was done
@@ -252,11 +272,38 @@ class UCC(EvolvedOperatorAnsatz):
             # the converter inserting None as the result if an operator did not commute. Here
             # we are not interested in that just getting the valid set of operators so that
             # behavior is suppressed.
-            self.operators = self.qubit_converter.convert_match(excitation_ops, suppress_none=True)
+            if self._excitation_ops is not None:
+                self.operators = self.qubit_converter.convert_match(self._excitation_ops,
+                                                                    suppress_none=True)
+            else:
+                excitations = self._get_excitation_list()
+                if len(excitations) >= QubitConverter.PARALLEL_THRESHOLD:
+                    # For large excitation sets the batch conversion is preferred, because the
+                    # converter distributes the mapping of a batch across processes.
+                    excitation_ops = self._build_fermionic_excitation_ops(excitations)
+                    self.operators = self.qubit_converter.convert_match(excitation_ops,
+                                                                        suppress_none=True)
+                else:
+                    # Otherwise we stream the operators through the converter one at a time.
+                    # This way only a single `FermionicOp` intermediate exists at any point,
+                    # instead of the full excitation list peaking the memory consumption during
+                    # the conversion.
+                    operators = []
+                    for exc in excitations:
+                        excitation_op = self._build_fermionic_excitation_op(exc)
+                        qubit_op = self.qubit_converter.convert_match(excitation_op)
+                        if qubit_op is not None:
+                            operators.append(qubit_op)
+                    self.operators = operators
 
         logger.debug('Building QuantumCircuit...')
         super()._build()
 
+        # remember the converter state the circuit was built against, so that later
+        # re-assignments of an equivalent converter do not needlessly invalidate it
+        self._qubit_converter_state = \
+            self._qubit_converter._state_key()  # pylint: disable=protected-access
+
     def excitation_ops(self) -> List[SecondQuantizedOp]:
         """Parses the excitations and generates the list of operators.
 
@@ -335,19 +382,27 @@ class UCC(EvolvedOperatorAnsatz):
         Returns:
             The list of excitation operators in the second quantized formalism.
         """
-        operators = []
-
-        for exc in excitations:
-            label = ['I'] * self.num_spin_orbitals
-            for occ in exc[0]:
-                label[occ] = '+'
-            for unocc in exc[1]:
-                label[unocc] = '-'
-            op = FermionicOp(''.join(label))
-            op -= op.adjoint()
-            # we need to account for an additional imaginary phase in the exponent (see also
-            # `PauliTrotterEvolution.convert`)
-            op *= 1j
-            operators.append(op)
-
-        return operators
+        return [self._build_fermionic_excitation_op(exc) for exc in excitations]
+
+    def _build_fermionic_excitation_op(self, excitation: Tuple[Tuple[int, ...], Tuple[int, ...]]
+                                       ) -> FermionicOp:
+        """Builds the anti-Hermitian operator of a single excitation.
+
+        Args:
+            excitation: the excitation encoded as a pair of tuples of the occupied and unoccupied
+                spin orbital indices.
+
+        Returns:
+            The excitation operator in the second quantized formalism.
+        """
+        label = ['I'] * self.num_spin_orbitals
+        for occ in excitation[0]:
+            label[occ] = '+'
+        for unocc in excitation[1]:
+            label[unocc] = '-'
+        op = FermionicOp(''.join(label))
+        op -= op.adjoint()
+        # we need to account for an additional imaginary phase in the exponent (see also
+        # `PauliTrotterEvolution.convert`)
+        op *= 1j
+        return op
@@ -13,17 +13,73 @@
 The UCCSD Ansatz.
 """
 
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import logging
 
-from qiskit.circuit import QuantumCircuit
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.parametervector import ParameterVectorElement
+from qiskit.opflow import PauliSumOp
+from qiskit_nature import QiskitNatureError
+from qiskit_nature.mappers.second_quantization import JordanWignerMapper
+from qiskit_nature.operators.second_quantization._majorana_cache import jw_excitation_ops_batch
 from qiskit_nature.operators.second_quantization.qubit_converter import QubitConverter
 from .ucc import UCC
+from .utils.fermionic_excitation_generator import generate_sd_excitation_arrays
 
 logger = logging.getLogger(__name__)
 
 
+def _generate_sd_excitations(num_spin_orbitals: int,
+                             num_particles: Tuple[int, int]
+                             ) -> List[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+    """Generates the list of single and double excitations used by the UCCSD Ansatz.
+
+    Args:
+        num_spin_orbitals: the number of spin orbitals.
+        num_particles: the number of alpha and beta electrons.
+
+    Returns:
+        The list of excitations encoded as tuples of tuples. Each tuple in the list is a pair of
+        tuples. The first tuple contains the occupied spin orbital indices whereas the second
+        one contains the indices of the unoccupied spin orbitals.
+    """
+    singles, doubles = generate_sd_excitation_arrays(num_spin_orbitals, num_particles)
+
+    excitations: List[Tuple[Tuple[int, ...], Tuple[int, ...]]] = \
+        [((int(occ),), (int(unocc),)) for occ, unocc in singles]
+    excitations.extend(((int(occ1), int(occ2)), (int(unocc1), int(unocc2)))
+                       for occ1, occ2, unocc1, unocc2 in doubles)
+    return excitations
+
+
+# The number of distinct configurations retained per cache. The cached values (in particular the
+# synthesized circuit templates) can be large, so the caches are bounded: once full, storing a new
+# configuration evicts the oldest one.
+_CACHE_SIZE = 8
+
+# The generation and mapping of the excitation operators depends only on the system size and the
+# converter settings. Since these are identical across the repeated `UCCSD` instantiations which
+# occur during e.g. a BOPES sampling, we share the generated operators across all instances of
+# this class via this module-level cache.
+_operator_cache: Dict[Tuple, List[PauliSumOp]] = {}
+
+# The synthesized circuit (without the initial state) is likewise fully determined by the system
+# size, the converter settings, the repetitions and the spin restriction. Caching one template per
+# such configuration reduces repeated instantiations to a single circuit composition.
+_circuit_cache: Dict[Tuple, QuantumCircuit] = {}
+
+
+def _cache_put(cache: Dict, key: Tuple, value) -> None:
+    """Stores a cache entry, evicting the oldest entry once the cache is full."""
+    if key not in cache and len(cache) >= _CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
 class UCCSD(UCC):
     """The UCCSD Ansatz.
 
@@ -34,7 +90,9 @@ class UCCSD(UCC):
                  num_particles: Optional[Tuple[int, int]] = None,
                  num_spin_orbitals: Optional[int] = None,
                  reps: int = 1,
-                 initial_state: Optional[QuantumCircuit] = None):
+                 initial_state: Optional[QuantumCircuit] = None,
+                 spin_restricted: bool = False,
+                 lazy: bool = False):
         """
         Args:
             qubit_converter: the QubitConverter instance which takes care of mapping a
@@ -44,13 +102,305 @@ class UCCSD(UCC):
             num_spin_orbitals: the number of spin orbitals.
             reps: The number of times to repeat the evolved operators.
             initial_state: A `QuantumCircuit` object to prepend to the circuit.
+            spin_restricted: when set, the excitation amplitudes are restricted to be symmetric
+                under the exchange of the alpha and beta spin species. Every beta-spin (and
+                spin-mirrored mixed-spin) excitation then shares the circuit parameter of its
+                alpha-spin mirror, which roughly halves the parameter count. This requires equal
+                numbers of alpha and beta electrons.
+            lazy: when set, the circuit construction is deferred until the first attribute access
+                which requires the circuit to be built.
+
+        Raises:
+            QiskitNatureError: if `spin_restricted` is set but the number of alpha and beta
+                electrons differs.
         """
+        self._spin_restricted = spin_restricted
+        if spin_restricted and num_particles is not None:
+            self._validate_num_particles(num_particles)
         super().__init__(qubit_converter=qubit_converter,
                          num_particles=num_particles,
                          num_spin_orbitals=num_spin_orbitals,
-                         excitations='sd',
+                         excitations=_generate_sd_excitations,
                          alpha_spin=True,
                          beta_spin=True,
                          max_spin_excitation=None,
                          reps=reps,
                          initial_state=initial_state)
+
+        # If the Ansatz is fully configured we build the circuit eagerly. This ensures that the
+        # expensive operator construction happens exactly once, inside the constructing process,
+        # rather than being repeated by every worker to which an unbuilt instance gets pickled
+        # (e.g. by Qiskit's `parallel_map` during transpilation).
+        if not lazy and self._may_build_eagerly():
+            self._build()
+
+    def _may_build_eagerly(self) -> bool:
+        """Whether the circuit may be built at construction time.
+
+        Building eagerly is only safe when the conversion of the excitation operators cannot be
+        affected by state which the converter has yet to learn from the conversion of the main
+        operator (see the note in :meth:`UCC._build` about converting according to the saved
+        converter state). Concretely, this requires a complete configuration, converter settings
+        which determine the conversion outcome on their own (in particular no Z2 symmetry
+        reduction, see :meth:`_operator_cache_key`) and no two-qubit reduction still awaiting the
+        number of particles from :meth:`~.QubitConverter.convert`. In all other cases the
+        construction stays deferred until after the main operator has been converted.
+        """
+        if self._operator_cache_key() is None:
+            return False
+
+        converter = self.qubit_converter
+        if converter.two_qubit_reduction and converter.num_particles is None:
+            return False
+
+        return True
+
+    @property
+    def spin_restricted(self) -> bool:
+        """Whether the amplitudes are restricted to be spin-exchange symmetric."""
+        return self._spin_restricted
+
+    def _validate_num_particles(self, num_particles: Tuple[int, int]) -> None:
+        if num_particles[0] != num_particles[1]:
+            raise QiskitNatureError(
+                'The spin-restricted UCCSD Ansatz requires equal numbers of alpha and beta '
+                'electrons, but {} were specified.'.format(num_particles)
+            )
+
+    @property
+    def num_parameters(self) -> int:
+        """The number of parameters of the Ansatz.
+
+        For the fixed singles-and-doubles excitation set of this class the parameter count
+        follows in closed form from the system size, so querying it does not force the (much more
+        expensive) circuit construction. We only fall back to building the circuit when the
+        operators were supplied externally (e.g. by ``AdaptVQE``) or when a Z2 symmetry reduction
+        is configured, because tapering may drop non-commuting excitation operators.
+        """
+        if self._data is None \
+                and (self.operators is None or self.operators == [None]) \
+                and self._operator_cache_key() is not None:
+            num_alpha, num_beta = self.num_particles
+            num_orbitals = self.num_spin_orbitals // 2
+            virt_alpha = num_orbitals - num_alpha
+            virt_beta = num_orbitals - num_beta
+
+            singles_alpha = num_alpha * virt_alpha
+            singles_beta = num_beta * virt_beta
+
+            if self._spin_restricted:
+                # only the alpha-spin singles and alpha-alpha doubles remain independent, and of
+                # the mixed-spin doubles only one representative per unordered mirror pair
+                num_singles = singles_alpha
+                num_doubles = \
+                    (num_alpha * (num_alpha - 1) // 2) * (virt_alpha * (virt_alpha - 1) // 2) \
+                    + (singles_alpha * singles_alpha + singles_alpha) // 2
+            else:
+                num_singles = singles_alpha + singles_beta
+                num_doubles = \
+                    (num_alpha * (num_alpha - 1) // 2) * (virt_alpha * (virt_alpha - 1) // 2) \
+                    + singles_alpha * singles_beta \
+                    + (num_beta * (num_beta - 1) // 2) * (virt_beta * (virt_beta - 1) // 2)
+
+            return self.reps * (num_singles + num_doubles)
+
+        return super().num_parameters
+
+    @property
+    def preferred_init_points(self):
+        """Getter of preferred initial points based on the given initial state."""
+        if self._initial_state is None:
+            return None
+
+        # The base class sizes the initial point as `reps * len(operators)`, which over-counts
+        # when the spin restriction ties parameters together, so we rely on the actual parameter
+        # count of the built circuit instead.
+        self._build()
+        return np.zeros(self.num_parameters, dtype=float)
+
+    def _operator_cache_key(self) -> Optional[Tuple]:
+        """Computes the key under which the converted operators of this Ansatz may be cached.
+
+        Returns ``None`` if the configuration is incomplete or if the converter cannot summarize
+        its settings in a cheap, hashable key (e.g. because a Z2 symmetry reduction is
+        configured, whose tapered operators depend on the symmetries detected from the main
+        operator).
+        """
+        converter = self.qubit_converter
+        if converter is None or self.num_particles is None or self.num_spin_orbitals is None:
+            return None
+
+        converter_key = converter._settings_key()  # pylint: disable=protected-access
+        if converter_key is None:
+            return None
+
+        return (self.num_spin_orbitals, self.num_particles) + converter_key
+
+    def _may_map_directly(self) -> bool:
+        """Whether the excitations may be mapped via the cached Jordan-Wigner templates.
+
+        This is only the case when the configured mapper is the plain
+        :class:`~qiskit_nature.mappers.second_quantization.JordanWignerMapper` and no symmetry
+        reductions are requested, because then the mapping of every excitation operator is fully
+        determined by its index tuple and the register length. Besides the configured settings
+        this also inspects the symmetry state which a prior :meth:`convert` may have stored on
+        the converter (e.g. symmetries detected under an ``'auto'`` reduction), so the decision
+        is safe regardless of the converter's history.
+        """
+        converter = self.qubit_converter
+        # the exact-type check is deliberate: a subclass may override the mapping, in which case
+        # the cached templates would no longer be valid
+        # pylint: disable=unidiomatic-typecheck
+        if type(converter.mapper) is not JordanWignerMapper:
+            return False
+
+        if converter.two_qubit_reduction or converter.z2symmetry_reduction is not None:
+            return False
+
+        z2symmetries = converter.z2symmetries
+        return z2symmetries is None or z2symmetries.is_empty()
+
+    def _build(self) -> None:
+        if self._data is not None:
+            return
+
+        cache_key = None
+        template_key = None
+        if self.operators is None or self.operators == [None]:
+            cache_key = self._operator_cache_key()
+
+            if cache_key is not None:
+                template_key = (cache_key, self.reps, self._spin_restricted)
+                template = _circuit_cache.get(template_key)
+                if template is not None and cache_key in _operator_cache:
+                    logger.debug('Instantiating the circuit from the cached template for %s',
+                                 template_key)
+                    self.operators = list(_operator_cache[cache_key])
+                    self._build_from_template(template)
+                    return
+
+            if cache_key is not None and cache_key in _operator_cache:
+                logger.debug('Reusing cached excitation operators for %s', cache_key)
+                self.operators = list(_operator_cache[cache_key])
+            elif cache_key is not None and self._may_map_directly():
+                logger.debug('Mapping the excitations via the cached Jordan-Wigner templates...')
+                singles, doubles = generate_sd_excitation_arrays(self.num_spin_orbitals,
+                                                                 self.num_particles)
+                register_length = self.num_spin_orbitals
+                self.operators = \
+                    jw_excitation_ops_batch(singles, register_length) \
+                    + jw_excitation_ops_batch(doubles, register_length)
+
+        # The initial state is withheld during the construction and only composed at the very
+        # end, so that the cached circuit template stays independent of it.
+        initial_state = self._initial_state
+        self._initial_state = None
+        try:
+            super()._build()
+        finally:
+            self._initial_state = initial_state
+
+        if cache_key is not None:
+            _cache_put(_operator_cache, cache_key, list(self.operators))
+
+        if self._spin_restricted:
+            self._tie_spin_parameters()
+
+        if template_key is not None:
+            _cache_put(_circuit_cache, template_key, self.copy())
+
+        if self._initial_state:
+            self.compose(self._initial_state, front=True, inplace=True)
+
+    def _build_from_template(self, template: QuantumCircuit) -> None:
+        """Rebuilds the circuit data by composing a cached, already synthesized template.
+
+        The template is copied during the composition, so the parameterized instructions of this
+        instance remain independent of the cached circuit.
+        """
+        self._check_configuration()
+        self._data = []
+
+        try:
+            qr = QuantumRegister(template.num_qubits, 'q')
+            self.add_register(qr)
+        except CircuitError:
+            # the register already exists, probably because of a previous composition
+            pass
+
+        self.compose(template.copy(), inplace=True)
+
+        if self._initial_state:
+            self.compose(self._initial_state, front=True, inplace=True)
+
+    def _tie_spin_parameters(self) -> None:
+        """Binds the parameter of every excitation to the one of its alpha-spin mirror.
+
+        Two excitations mirror each other when exchanging the alpha and beta spin species maps one
+        onto the other, i.e. when they touch the same spatial orbitals with the same excitation
+        structure. Each mirror group retains a single circuit parameter, namely the one of its
+        first member in excitation order.
+
+        Raises:
+            QiskitNatureError: if the number of alpha and beta electrons differs, or if the
+                operators of this Ansatz do not comprise the full set of singles and doubles
+                excitations (e.g. because a Z2 symmetry reduction dropped some of them).
+        """
+        self._validate_num_particles(self.num_particles)
+
+        singles, doubles = generate_sd_excitation_arrays(self.num_spin_orbitals,
+                                                         self.num_particles)
+        beta_index_shift = self.num_spin_orbitals // 2
+
+        # pair up mirrored excitations by their canonical key: the sorted spatial index pairs
+        # plus a flag separating the same-spin from the mixed-spin doubles (which can share
+        # spatial indices without being mirrors of each other)
+        ties = []
+        first_occurrence: Dict[Tuple, int] = {}
+
+        def _record(index: int, spin_pairs: List[Tuple[int, int]], mixed_spin: bool) -> None:
+            spatial_pairs = tuple(sorted((occ % beta_index_shift, unocc % beta_index_shift)
+                                         for occ, unocc in spin_pairs))
+            canonical = (spatial_pairs, mixed_spin)
+            if canonical in first_occurrence:
+                ties.append((index, first_occurrence[canonical]))
+            else:
+                first_occurrence[canonical] = index
+
+        for index, (occ, unocc) in enumerate(singles):
+            _record(index, [(occ, unocc)], False)
+
+        offset = len(singles)
+        for index, (occ1, occ2, unocc1, unocc2) in enumerate(doubles):
+            mixed_spin = (occ1 < beta_index_shift) != (occ2 < beta_index_shift)
+            _record(offset + index, [(occ1, unocc1), (occ2, unocc2)], mixed_spin)
+
+        if not ties:
+            return
+
+        num_excitations = offset + len(doubles)
+        if len(self.operators) != num_excitations:
+            raise QiskitNatureError(
+                'The spin restriction requires the full set of {} singles and doubles excitation '
+                'operators, but this Ansatz holds {}.'.format(num_excitations, len(self.operators))
+            )
+
+        # The evolution parameters are assigned to the excitations in repetition-major order, so
+        # sorting the vector elements by index recovers that assignment.
+        parameters = [param for param in self.parameters
+                      if isinstance(param, ParameterVectorElement)]
+        parameters.sort(key=lambda param: param.index)
+        if len(parameters) != self.reps * num_excitations:
+            raise QiskitNatureError(
+                'Expected {} circuit parameters but found {}.'.format(
+                    self.reps * num_excitations, len(parameters))
+            )
+
+        bindings = {}
+        for rep in range(self.reps):
+            rep_offset = rep * num_excitations
+            for redundant, representative in ties:
+                bindings[parameters[rep_offset + redundant]] = \
+                    parameters[rep_offset + representative]
+
+        self.assign_parameters(bindings, inplace=True)
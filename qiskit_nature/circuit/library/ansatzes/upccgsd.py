@@ -0,0 +1,109 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+The UpCCGSD Ansatz.
+"""
+
+from typing import List, Optional, Tuple
+
+import itertools
+import logging
+
+from qiskit.circuit import QuantumCircuit
+from qiskit_nature.operators.second_quantization.qubit_converter import QubitConverter
+
+from .ucc import UCC
+
+logger = logging.getLogger(__name__)
+
+
+class UpCCGSD(UCC):
+    """The UpCCGSD Ansatz.
+
+    The UpCCGSD Ansatz consists of generalized single excitations, which connect every pair of
+    spatial orbitals regardless of their occupation, and of paired double excitations, which move
+    an alpha-beta electron pair between two spatial orbitals. Compared to the :class:`UCCSD`
+    Ansatz this reduces the number of excitations (and with it the circuit depth and parameter
+    count) from scaling quartically to quadratically in the number of orbitals. The `k`-UpCCGSD
+    Ansatz of [1] is obtained by setting `reps=k`. For more information see also [1].
+
+    This is a convenience subclass of the UCC Ansatz. For more information refer to :class:`UCC`.
+
+    References:
+
+        [1] https://arxiv.org/abs/1810.02327
+    """
+
+    def __init__(self, qubit_converter: Optional[QubitConverter] = None,
+                 num_particles: Optional[Tuple[int, int]] = None,
+                 num_spin_orbitals: Optional[int] = None,
+                 reps: int = 1,
+                 initial_state: Optional[QuantumCircuit] = None,
+                 ):
+        """
+
+        Args:
+            qubit_converter: the QubitConverter instance which takes care of mapping a
+                :class:`~.SecondQuantizedOp` to a :class:`PauliSumOp` as well as performing all
+                configured symmetry reductions on it.
+            num_particles: the tuple of the number of alpha- and beta-spin particles.
+            num_spin_orbitals: the number of spin orbitals.
+            reps: The number of times to repeat the evolved operators.
+            initial_state: A `QuantumCircuit` object to prepend to the circuit.
+        """
+        super().__init__(qubit_converter=qubit_converter,
+                         num_particles=num_particles,
+                         num_spin_orbitals=num_spin_orbitals,
+                         excitations=self.generate_excitations,
+                         alpha_spin=True,
+                         beta_spin=True,
+                         max_spin_excitation=None,
+                         reps=reps,
+                         initial_state=initial_state)
+
+    def generate_excitations(self, num_spin_orbitals: int,
+                             num_particles: Tuple[int, int]  # pylint: disable=unused-argument
+                             ) -> List[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+        """Generates the excitations for the UpCCGSD Ansatz.
+
+        Args:
+            num_spin_orbitals: the number of spin orbitals.
+            num_particles: the number of alpha and beta electrons. Note, the generalized
+                excitations do not actually depend on the occupation, so this argument is only
+                present for API compatibility with the excitation generator contract.
+
+        Returns:
+            The list of excitations encoded as tuples of tuples. Each tuple in the list is a pair of
+            tuples. The first tuple contains the occupied spin orbital indices whereas the second
+            one contains the indices of the unoccupied spin orbitals.
+        """
+        beta_index_shift = num_spin_orbitals // 2
+
+        excitations: List[Tuple[Tuple[int, ...], Tuple[int, ...]]] = list()
+        exc_tuple: Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+        # the generalized singles connect every (ordered) pair of spatial orbitals within each
+        # spin species, regardless of the reference occupation
+        for spin_shift in (0, beta_index_shift):
+            for orb_from, orb_to in itertools.combinations(range(beta_index_shift), 2):
+                exc_tuple = ((orb_from + spin_shift,), (orb_to + spin_shift,))
+                excitations.append(exc_tuple)
+                logger.debug('Added the excitation: %s', exc_tuple)
+
+        # the paired doubles move an alpha-beta electron pair between two spatial orbitals
+        for orb_from, orb_to in itertools.combinations(range(beta_index_shift), 2):
+            exc_tuple = ((orb_from, orb_from + beta_index_shift),
+                         (orb_to, orb_to + beta_index_shift))
+            excitations.append(exc_tuple)
+            logger.debug('Added the excitation: %s', exc_tuple)
+
+        return excitations
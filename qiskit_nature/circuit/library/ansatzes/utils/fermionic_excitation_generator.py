@@ -21,14 +21,35 @@ can occur within the same spin. Thus, setting `max_spin_excitation=1` and `num_e
 only those double excitations which do not excite the same spin species twice.
 """
 
-from typing import Iterator, List, Tuple, Optional
+from typing import Iterator, List, NamedTuple, Tuple, Optional
 
 import itertools
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+class SDExcitations(NamedTuple):
+    """The single and double excitations of an :class:`~.UCCSD`-type Ansatz in a
+    struct-of-arrays layout.
+
+    Storing the excitations as two contiguous integer arrays rather than as a list of nested
+    index tuples keeps the memory footprint small and allows downstream consumers (like the
+    vectorized Jordan-Wigner mapping) to process whole batches without any Python-object
+    overhead.
+    """
+
+    singles: np.ndarray
+    """Array of shape ``(num_singles, 2)`` with one excitation per row, storing the occupied
+    followed by the unoccupied spin orbital index."""
+
+    doubles: np.ndarray
+    """Array of shape ``(num_doubles, 4)`` with one excitation per row, storing the two occupied
+    followed by the two unoccupied spin orbital indices."""
+
+
 def generate_fermionic_excitations(num_excitations: int,
                                    num_spin_orbitals: int,
                                    num_particles: Tuple[int, int],
@@ -126,3 +147,59 @@ def generate_fermionic_excitations(num_excitations: int,
             logger.debug('Added the excitation: %s', exc_tuple)
 
     return excitations
+
+
+def generate_sd_excitation_arrays(num_spin_orbitals: int,
+                                  num_particles: Tuple[int, int],
+                                  ) -> SDExcitations:
+    """Generates the full set of single and double excitations as index arrays.
+
+    This is a specialization of :meth:`generate_fermionic_excitations` for the most common
+    use-case, the :class:`~.UCCSD` Ansatz. Rather than enumerating all pairs of single excitations
+    and filtering out the invalid and duplicated combinations afterwards, the explicit loops below
+    only ever visit the valid doubles. The excitations are produced in the identical order to the
+    generic method and are returned in a struct-of-arrays layout which downstream consumers can
+    process without any further Python-object overhead.
+
+    This method assumes block-ordered spin-orbitals.
+
+    Args:
+        num_spin_orbitals: number of spin-orbitals.
+        num_particles: number of alpha and beta particles.
+
+    Returns:
+        The single and double excitations bundled as an :class:`SDExcitations` instance of two
+        integer index arrays.
+    """
+    num_alpha, num_beta = num_particles
+    beta_index_shift = num_spin_orbitals // 2
+
+    alpha_occ = range(num_alpha)
+    alpha_unocc = range(num_alpha, beta_index_shift)
+    beta_occ = range(beta_index_shift, beta_index_shift + num_beta)
+    beta_unocc = range(beta_index_shift + num_beta, num_spin_orbitals)
+
+    alpha_singles = [(occ, unocc) for occ in alpha_occ for unocc in alpha_unocc]
+    beta_singles = [(occ, unocc) for occ in beta_occ for unocc in beta_unocc]
+
+    doubles = []
+    # The doubles are ordered like the pairs drawn by `itertools.combinations` from the combined
+    # list of singles: each alpha-spin single is joined first with the later pure alpha-spin
+    # partners and then with every beta-spin single, before the pure beta-spin pairs follow at the
+    # very end. Within one spin species, a pair of singles is a new, valid double excitation if
+    # and only if both the occupied and the unoccupied indices are strictly increasing.
+    for spin_singles in (alpha_singles, beta_singles):
+        for index, (occ, unocc) in enumerate(spin_singles):
+            for other_occ, other_unocc in spin_singles[index + 1:]:
+                if other_occ > occ and other_unocc > unocc:
+                    doubles.append((occ, other_occ, unocc, other_unocc))
+            if spin_singles is alpha_singles:
+                for other_occ, other_unocc in beta_singles:
+                    doubles.append((occ, other_occ, unocc, other_unocc))
+
+    singles_array = np.asarray(alpha_singles + beta_singles, dtype=np.int32).reshape((-1, 2))
+    doubles_array = np.asarray(doubles, dtype=np.int32).reshape((-1, 4))
+
+    logger.debug('Generated %s singles and %s doubles', len(singles_array), len(doubles_array))
+
+    return SDExcitations(singles_array, doubles_array)
@@ -18,7 +18,7 @@ from typing import List, Tuple
 import numpy as np
 
 from qiskit.opflow import PauliSumOp
-from qiskit.quantum_info.operators import Pauli, SparsePauliOp
+from qiskit.quantum_info.operators import Pauli, PauliTable, SparsePauliOp
 
 from qiskit_nature import QiskitNatureError
 from qiskit_nature.operators.second_quantization import SecondQuantizedOp
@@ -132,5 +132,14 @@ class QubitMapper(ABC):
                     )
             ret_op_list.append(ret_op)
 
-        zero_op = SparsePauliOp(Pauli((all_false, all_false)), coeffs=[0])
-        return PauliSumOp(sum(ret_op_list, zero_op)).reduce()
+        if not ret_op_list:
+            zero_op = SparsePauliOp(Pauli((all_false, all_false)), coeffs=[0])
+            return PauliSumOp(zero_op).reduce()
+
+        # Summing the operators one by one copies the accumulated tables over and over, which
+        # makes the reduction quadratic in the number of terms. Instead, we concatenate all
+        # symplectic tables and coefficient arrays in one pass and leave the collection of
+        # duplicate Pauli terms to the final `reduce()`.
+        table = PauliTable(np.vstack([ret_op.table.array for ret_op in ret_op_list]))
+        coeffs = np.concatenate([ret_op.coeffs for ret_op in ret_op_list])
+        return PauliSumOp(SparsePauliOp(table, coeffs=coeffs)).reduce()
@@ -0,0 +1,245 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A cache of Jordan-Wigner mapped excitation operators (internal).
+
+Mapping the excitation operators of the UCC-style Ansatzes through the generic
+:class:`~qiskit_nature.operators.second_quantization.qubit_converter.QubitConverter` stack
+dominates their construction time. For the plain Jordan-Wigner case the mapping of an excitation
+is fully determined by its index tuple and the register length, which makes it an ideal candidate
+for memoization. The helpers in this module assemble the mapped operators from the two cached
+Majorana-type Pauli strings of every mode, bypassing the `FermionicOp` intermediates and the label
+parsing of the generic mapping path entirely. The composition order of the Pauli factors matches
+:meth:`~qiskit_nature.mappers.second_quantization.QubitMapper.mode_based_mapping`, so the resulting
+operators are identical to those produced by the
+:class:`~qiskit_nature.mappers.second_quantization.JordanWignerMapper`.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from qiskit.opflow import PauliSumOp
+from qiskit.quantum_info.operators import Pauli, PauliTable, SparsePauliOp
+
+from qiskit_nature import QiskitNatureError
+
+
+@lru_cache(maxsize=None)
+def _z_prefix_rows(register_length: int) -> np.ndarray:
+    """The Jordan-Wigner Z-prefix masks of all modes of a register.
+
+    Row ``j`` of the returned boolean matrix flags all modes below ``j``, i.e. the support of the
+    Z-string which the Jordan-Wigner transform attaches to mode ``j``. Since Z-strings compose as
+    XORs in the symplectic representation, sharing these rows across all excitations reduces the
+    Z-string assembly to constant-time row lookups and XORs.
+    """
+    modes = np.arange(register_length)
+    return modes[None, :] < modes[:, None]
+
+
+@lru_cache(maxsize=None)
+def _majorana_paulis(mode: int, register_length: int) -> Tuple[Pauli, Pauli]:
+    """The pair of Majorana-type Pauli strings of a mode under the Jordan-Wigner transform.
+
+    Args:
+        mode: the index of the fermionic mode.
+        register_length: the total number of fermionic modes.
+
+    Returns:
+        The X-type and Y-type Pauli string of the given mode, each carrying the Z-string on all
+        preceding modes.
+    """
+    prefix = _z_prefix_rows(register_length)[mode]
+
+    a_z = prefix.copy()
+    a_x = np.zeros(register_length, dtype=bool)
+    a_x[mode] = True
+    b_z = prefix.copy()
+    b_z[mode] = True
+
+    return Pauli((a_z, a_x)), Pauli((b_z, a_x.copy()))
+
+
+@lru_cache(maxsize=None)
+def _creation_op(mode: int, register_length: int) -> SparsePauliOp:
+    """The Jordan-Wigner mapped creation operator of the given mode."""
+    real_part, imag_part = _majorana_paulis(mode, register_length)
+    return SparsePauliOp(real_part, coeffs=[0.5]) + SparsePauliOp(imag_part, coeffs=[0.5j])
+
+
+@lru_cache(maxsize=None)
+def _annihilation_op(mode: int, register_length: int) -> SparsePauliOp:
+    """The Jordan-Wigner mapped annihilation operator of the given mode."""
+    real_part, imag_part = _majorana_paulis(mode, register_length)
+    return SparsePauliOp(real_part, coeffs=[0.5]) + SparsePauliOp(imag_part, coeffs=[-0.5j])
+
+
+@lru_cache(maxsize=None)
+def jordan_wigner_excitation_op(excitation: Tuple[Tuple[int, ...], Tuple[int, ...]],
+                                register_length: int) -> PauliSumOp:
+    """Maps an excitation directly onto its Jordan-Wigner transformed qubit operator.
+
+    The returned operator matches the one obtained by constructing the anti-Hermitian excitation
+    operator :math:`i (T - T^{\\dagger})` as a `FermionicOp` and mapping it with the
+    :class:`~qiskit_nature.mappers.second_quantization.JordanWignerMapper`.
+
+    Args:
+        excitation: the excitation encoded as a pair of tuples. The first tuple contains the
+            occupied spin orbital indices whereas the second one contains the indices of the
+            unoccupied spin orbitals.
+        register_length: the total number of fermionic modes.
+
+    Returns:
+        The qubit operator of the excitation in the form of a `PauliSumOp`.
+    """
+    occ, unocc = excitation
+
+    factors = sorted([(mode, _creation_op) for mode in occ]
+                     + [(mode, _annihilation_op) for mode in unocc])
+
+    mode, factory = factors[0]
+    base = factory(mode, register_length)
+    for mode, factory in factors[1:]:
+        base = base & factory(mode, register_length)
+
+    # we need to account for an additional imaginary phase in the exponent (see also
+    # `PauliTrotterEvolution.convert`)
+    op = 1j * (base - base.adjoint())
+
+    return PauliSumOp(op.simplify())
+
+
+@lru_cache(maxsize=None)
+def _excitation_template(pattern: Tuple[str, ...]
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Extracts the Pauli-term template of an excitation pattern.
+
+    The Jordan-Wigner mapped operator of an excitation has a rigid structure: the Z-string
+    segments between consecutive excitation indices are shared by all of its Pauli terms, while
+    the terms only differ in the on-site Paulis at the excitation indices and in their
+    coefficients. Both the on-site Paulis and the coefficients are invariant under any
+    order-preserving relabeling of the indices, because the composition phases only depend on the
+    overlaps of the factor supports. This method therefore maps one canonical representative of
+    the given pattern (the sequence of creation/annihilation characters in ascending index order)
+    through :meth:`jordan_wigner_excitation_op` and extracts the data required to translate its
+    terms to arbitrary index tuples.
+
+    Args:
+        pattern: the ``+``/``-`` characters of the excitation in ascending index order.
+
+    Returns:
+        A tuple of the Z-bits of the gaps surrounding the excitation indices (one entry more than
+        the number of indices), the on-site Z-bits, the on-site X-bits (each with one row per
+        Pauli term and one column per excitation index) and the term coefficients.
+
+    Raises:
+        QiskitNatureError: if the mapped operator of the canonical representative violates the
+            Z-string structure which the batch mapping relies on.
+    """
+    num_factors = len(pattern)
+    # The canonical representative spreads its indices to the odd positions so that every gap
+    # (including the ones below and above all indices) contains a readable representative qubit.
+    canonical_positions = [2 * index + 1 for index in range(num_factors)]
+    register_length = 2 * num_factors + 1
+
+    occ = tuple(pos for pos, char in zip(canonical_positions, pattern) if char == '+')
+    unocc = tuple(pos for pos, char in zip(canonical_positions, pattern) if char == '-')
+
+    canonical = jordan_wigner_excitation_op((occ, unocc), register_length).primitive
+
+    z_rows = canonical.table.Z
+    x_rows = canonical.table.X
+
+    onsite_z = z_rows[:, canonical_positions]
+    onsite_x = x_rows[:, canonical_positions]
+
+    gap_positions = [0] + [2 * index + 2 for index in range(num_factors)]
+    gap_z = z_rows[:, gap_positions]
+
+    # All terms share the Z-string structure since every factor carries the full Z-prefix. The
+    # gap below the m-th index is covered by the prefixes of all higher indices, hence its Z-bit
+    # is simply the parity of their count. This is what allows the batch mapping to assemble the
+    # Z-strings from an XOR over the cached prefix rows.
+    if not np.all(gap_z == gap_z[0]) \
+            or np.any(x_rows[:, gap_positions]) \
+            or any(gap_z[0][gap] != bool((num_factors - gap) % 2)
+                   for gap in range(num_factors + 1)):
+        raise QiskitNatureError(
+            'The mapped operator of the excitation pattern {} violates the Z-string structure '
+            'required by the batch mapping.'.format(pattern)
+        )
+
+    return gap_z[0].copy(), onsite_z.copy(), onsite_x.copy(), canonical.coeffs.copy()
+
+
+def jw_excitation_ops_batch(excitations: np.ndarray,
+                            register_length: int) -> List[PauliSumOp]:
+    """Maps a batch of equally-sized excitations onto their Jordan-Wigner qubit operators.
+
+    All excitations are processed in a single, vectorized pass over NumPy boolean arrays by
+    translating the cached Pauli-term templates of their patterns (see
+    :meth:`_excitation_template`) to the actual index tuples. The returned operators are identical
+    to those produced by :meth:`jordan_wigner_excitation_op`.
+
+    Args:
+        excitations: an integer array of shape ``(num_excitations, 2 * num_indices)`` storing one
+            excitation per row as its occupied followed by its unoccupied spin orbital indices.
+        register_length: the total number of fermionic modes.
+
+    Returns:
+        The list of qubit operators in the form of `PauliSumOp`s, in the order of the input rows.
+    """
+    num_excitations, num_factors = excitations.shape
+
+    operators: List[PauliSumOp] = [None] * num_excitations
+    if num_excitations == 0:
+        return operators
+
+    roles = np.asarray(['+'] * (num_factors // 2) + ['-'] * (num_factors // 2))
+    order = np.argsort(excitations, axis=1)
+    positions = np.take_along_axis(excitations, order, axis=1)
+    patterns = roles[order]
+
+    for pattern in np.unique(patterns, axis=0):
+        group = np.nonzero(np.all(patterns == pattern, axis=1))[0]
+        pos = positions[group]
+        group_size = len(group)
+
+        _, onsite_z, onsite_x, coeffs = _excitation_template(tuple(pattern))
+
+        # Every factor carries the full Z-prefix of its mode, so the shared Z-string of each
+        # excitation is the XOR of the cached prefix rows of all of its indices. The leftover
+        # bits at the indices themselves are overwritten by the on-site template below.
+        prefix_rows = _z_prefix_rows(register_length)
+        z_base = prefix_rows[pos[:, 0]]
+        for factor in range(1, num_factors):
+            z_base = z_base ^ prefix_rows[pos[:, factor]]
+
+        rows = np.arange(group_size)[:, None]
+        num_terms = len(coeffs)
+        z_terms = np.empty((num_terms, group_size, register_length), dtype=bool)
+        x_terms = np.zeros((num_terms, group_size, register_length), dtype=bool)
+        for term in range(num_terms):
+            z_terms[term] = z_base
+            z_terms[term][rows, pos] = onsite_z[term]
+            x_terms[term][rows, pos] = onsite_x[term]
+
+        # `PauliTable` stores its symplectic data as adjacent [X | Z] blocks, so the rows of
+        # every operator can be assembled directly in that layout, without constructing any
+        # intermediate `Pauli` objects or summing single-term operators.
+        for index, member in enumerate(group):
+            table = PauliTable(np.hstack((x_terms[:, index, :], z_terms[:, index, :])))
+            operators[member] = PauliSumOp(SparsePauliOp(table, coeffs=coeffs.copy()))
+
+    return operators
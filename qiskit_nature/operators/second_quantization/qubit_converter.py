@@ -20,6 +20,8 @@ import numpy as np
 from qiskit.opflow import PauliSumOp
 from qiskit.opflow.converters import TwoQubitReduction
 from qiskit.opflow.primitive_ops import Z2Symmetries
+from qiskit.tools import parallel_map
+from qiskit.utils import algorithm_globals
 
 from qiskit_nature import QiskitNatureError
 from qiskit_nature.mappers.second_quantization import QubitMapper
@@ -49,6 +51,12 @@ class QubitConverter:
     be passed in on :meth:`convert` which will override this value should both be given.
     """
 
+    # The minimum number of operators from which :meth:`convert_match` distributes the mapping
+    # across processes. Below this size the process start-up and pickling overhead outweighs the
+    # parallel speedup. This is public so that consumers which pre-build their operator batches
+    # (like the UCC Ansatz) can size them consistently with the dispatch.
+    PARALLEL_THRESHOLD = 100
+
     def __init__(self,
                  mapper: QubitMapper,
                  two_qubit_reduction: bool = False,
@@ -79,6 +87,9 @@ class QubitConverter:
         self._num_particles: Optional[Tuple[int, int]] = None
         self._z2symmetries: Z2Symmetries = self._no_symmetries
 
+        self._two_qubit_reducer: Optional[TwoQubitReduction] = None
+        self._two_qubit_reducer_particles: Optional[Tuple[int, int]] = None
+
     @property
     def _no_symmetries(self) -> Z2Symmetries:
         return Z2Symmetries([], [], [], None)
@@ -143,6 +154,47 @@ class QubitConverter:
         """
         return copy.deepcopy(self._z2symmetries)
 
+    def _settings_key(self) -> Optional[Tuple]:
+        """A cheap, hashable summary of the conversion settings of this converter.
+
+        Two converters with equal keys produce identical conversions, which allows consumers
+        (like the operator cache of the :class:`~.UCCSD` Ansatz) to key their caches on the
+        settings without any deep instance comparison. Returns ``None`` when the conversion
+        outcome is not determined by the static settings alone, i.e. when a Z2 symmetry
+        reduction is configured or when symmetry state from a prior :meth:`convert` is present.
+        """
+        if self._z2symmetry_reduction is not None:
+            return None
+
+        if self._z2symmetries is not None and not self._z2symmetries.is_empty():
+            return None
+
+        return (type(self._mapper).__name__, self._two_qubit_reduction, self._num_particles)
+
+    def _state_key(self) -> Tuple:
+        """A hashable summary of all state which influences :meth:`convert_match`.
+
+        In contrast to :meth:`_settings_key` this also covers the mutable symmetry state which
+        :meth:`convert` (or :meth:`force_match`) stores on the converter, so equal keys guarantee
+        identical conversions regardless of the converter histories. Consumers (like the
+        :class:`~.UCC` Ansatz) use this to decide whether a re-assigned converter actually
+        changes the conversion outcome.
+        """
+        z2reduction_key: Union[None, str, Tuple[int, ...]]
+        if isinstance(self._z2symmetry_reduction, list):
+            z2reduction_key = tuple(self._z2symmetry_reduction)
+        else:
+            z2reduction_key = self._z2symmetry_reduction
+
+        z2state: Tuple = ()
+        if self._z2symmetries is not None and not self._z2symmetries.is_empty():
+            z2state = (tuple(pauli.to_label() for pauli in self._z2symmetries.symmetries),
+                       tuple(self._z2symmetries.sq_list),
+                       tuple(self._z2symmetries.tapering_values or ()))
+
+        return (type(self._mapper).__name__, self._two_qubit_reduction, z2reduction_key,
+                self._num_particles, z2state)
+
     def convert(self, second_q_op: SecondQuantizedOp,
                 num_particles: Optional[Tuple[int, int]] = None,
                 sector_locator: Optional[Callable[[Z2Symmetries], Optional[List[int]]]] = None
@@ -231,7 +283,14 @@ class QubitConverter:
             wrapped = True
             suppress_none = False  # When only a single op we will return None back
 
-        qubit_ops = [self._map(second_q_op) for second_q_op in second_q_ops]
+        # The mapping of every operator is independent of all others, so for large batches (e.g.
+        # the excitation operators of a UCC-style Ansatz) it is distributed across processes.
+        if len(second_q_ops) >= self.PARALLEL_THRESHOLD \
+                and algorithm_globals.num_processes > 1:
+            qubit_ops = parallel_map(self._map, second_q_ops,
+                                     num_processes=algorithm_globals.num_processes)
+        else:
+            qubit_ops = [self._map(second_q_op) for second_q_op in second_q_ops]
         reduced_ops = [self._two_qubit_reduce(qubit_op, self._num_particles)
                        for qubit_op in qubit_ops]
         tapered_ops = self._symmetry_reduce(reduced_ops, suppress_none)
@@ -268,8 +327,14 @@ class QubitConverter:
 
         if num_particles is not None:
             if self._two_qubit_reduction and self._mapper.allows_two_qubit_reduction:
-                two_q_reducer = TwoQubitReduction(num_particles)
-                reduced_op = cast(PauliSumOp, two_q_reducer.convert(qubit_op))
+                # The reducer only depends on the number of particles, so we share one instance
+                # across all the operators converted for a given problem instead of constructing
+                # it anew for every single operator (e.g. for every excitation of an Ansatz).
+                if self._two_qubit_reducer is None \
+                        or self._two_qubit_reducer_particles != num_particles:
+                    self._two_qubit_reducer = TwoQubitReduction(num_particles)
+                    self._two_qubit_reducer_particles = num_particles
+                reduced_op = cast(PauliSumOp, self._two_qubit_reducer.convert(qubit_op))
 
         return reduced_op
 
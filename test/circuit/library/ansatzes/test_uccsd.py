@@ -17,8 +17,14 @@ from test.circuit.library.ansatzes.test_ucc import assert_ucc_like_ansatz
 
 from ddt import ddt, data, unpack
 
+import numpy as np
+
+from qiskit.quantum_info import Operator
+
+from qiskit_nature import QiskitNatureError
 from qiskit_nature.circuit.library.ansatzes import UCCSD
-from qiskit_nature.mappers.second_quantization import JordanWignerMapper
+from qiskit_nature.circuit.library.ansatzes import uccsd as uccsd_module
+from qiskit_nature.mappers.second_quantization import JordanWignerMapper, ParityMapper
 from qiskit_nature.operators.second_quantization import FermionicOp
 from qiskit_nature.operators.second_quantization.qubit_converter import QubitConverter
 
@@ -27,6 +33,12 @@ from qiskit_nature.operators.second_quantization.qubit_converter import QubitCon
 class TestUCCSD(QiskitNatureTestCase):
     """Tests for the UCCSD Ansatz."""
 
+    def setUp(self):
+        super().setUp()
+        # the caches are module state, so we isolate the tests from one another
+        uccsd_module._operator_cache.clear()
+        uccsd_module._circuit_cache.clear()
+
     @unpack
     @data(
         (4, (1, 1), [FermionicOp([('+-II', 1j), ('-+II', 1j)]),
@@ -88,3 +100,124 @@ class TestUCCSD(QiskitNatureTestCase):
                        num_spin_orbitals=num_spin_orbitals)
 
         assert_ucc_like_ansatz(self, ansatz, num_spin_orbitals, expect)
+
+    @unpack
+    @data(
+        (4, (1, 1)),
+        (6, (1, 1)),
+        (8, (2, 2)),
+        (8, (2, 1)),
+    )
+    def test_uccsd_num_parameters(self, num_spin_orbitals, num_particles):
+        """Tests the closed-form parameter count of the UCCSD Ansatz."""
+        converter = QubitConverter(JordanWignerMapper())
+
+        ansatz = UCCSD(qubit_converter=converter,
+                       num_particles=num_particles,
+                       num_spin_orbitals=num_spin_orbitals,
+                       lazy=True)
+
+        expected = ansatz.num_parameters
+        ansatz._build()
+
+        self.assertEqual(expected, len(ansatz.parameters))
+
+    def test_uccsd_repeated_instantiation(self):
+        """Tests that repeated instantiation (which reuses the cached circuit template) yields an
+        equivalent circuit."""
+        converter = QubitConverter(JordanWignerMapper())
+
+        first = UCCSD(qubit_converter=converter, num_particles=(1, 1), num_spin_orbitals=4)
+        # the first instance was built from scratch and populated the template cache, so the
+        # second one is instantiated from the cached template
+        self.assertTrue(uccsd_module._circuit_cache)
+        second = UCCSD(qubit_converter=converter, num_particles=(1, 1), num_spin_orbitals=4)
+
+        self.assertEqual(first, second)
+
+    def test_uccsd_assign_parameters_flat(self):
+        """Tests the flat parameter binding against the generic parameter assignment."""
+        converter = QubitConverter(JordanWignerMapper())
+
+        ansatz = UCCSD(qubit_converter=converter, num_particles=(1, 1), num_spin_orbitals=4)
+
+        values = np.linspace(-0.2, 0.3, ansatz.num_parameters)
+        flat_bound = ansatz.assign_parameters_flat(values)
+        generic_bound = ansatz.assign_parameters(dict(zip(ansatz.parameters, values)))
+
+        # the fast path must actually engage for this Ansatz instead of falling back
+        self.assertFalse(ansatz._flat_bind_unsupported)
+        self.assertIsNotNone(ansatz._flat_bind_map)
+
+        self.assertTrue(np.allclose(Operator(flat_bound).data, Operator(generic_bound).data))
+
+    def test_uccsd_deferred_build_pending_reduction(self):
+        """Tests that the eager construction is deferred when the conversion outcome depends on
+        converter state which only the conversion of the main operator provides."""
+        converter = QubitConverter(ParityMapper(), two_qubit_reduction=True)
+
+        ansatz = UCCSD(qubit_converter=converter, num_particles=(1, 1), num_spin_orbitals=4)
+
+        # the two-qubit reduction has not learned the number of particles yet, so building now
+        # would bake the unreduced operators into the circuit
+        self.assertIsNone(ansatz._data)
+
+    def test_uccsd_converter_state_change_invalidates(self):
+        """Tests that re-assigning a converter whose conversion state changed in the meantime
+        invalidates the circuit, while an unchanged re-assignment keeps it."""
+        converter = QubitConverter(ParityMapper(), two_qubit_reduction=True)
+
+        ansatz = UCCSD(qubit_converter=converter, num_particles=(1, 1), num_spin_orbitals=4)
+        ansatz._build()
+        self.assertIsNotNone(ansatz._data)
+
+        # unchanged state: re-assignment must not invalidate
+        ansatz.qubit_converter = converter
+        self.assertIsNotNone(ansatz._data)
+
+        # the converter learns the particle number (as the conversion of a main operator would);
+        # re-assigning it now must invalidate the stale, unreduced circuit
+        converter.force_match(num_particles=(1, 1))
+        ansatz.qubit_converter = converter
+        self.assertIsNone(ansatz._data)
+
+    def test_uccsd_spin_restricted(self):
+        """Tests the spin-restricted UCCSD Ansatz."""
+        converter = QubitConverter(JordanWignerMapper())
+
+        ansatz = UCCSD(qubit_converter=converter,
+                       num_particles=(2, 2),
+                       num_spin_orbitals=8,
+                       spin_restricted=True,
+                       lazy=True)
+
+        self.assertEqual(ansatz.num_parameters, 15)
+        ansatz._build()
+        self.assertEqual(len(ansatz.parameters), 15)
+
+    def test_uccsd_spin_restricted_particle_mismatch(self):
+        """Tests that the spin restriction rejects differing particle numbers."""
+        with self.assertRaises(QiskitNatureError):
+            UCCSD(num_particles=(2, 1), spin_restricted=True)
+
+    @unpack
+    @data(
+        (4, (1, 1)),
+        (6, (1, 1)),
+        (8, (2, 2)),
+        (8, (2, 1)),
+    )
+    def test_uccsd_matches_generic_mapping(self, num_spin_orbitals, num_particles):
+        """Tests that the direct Jordan-Wigner mapping matches the generic converter path."""
+        converter = QubitConverter(JordanWignerMapper())
+
+        ansatz = UCCSD(qubit_converter=converter,
+                       num_particles=num_particles,
+                       num_spin_orbitals=num_spin_orbitals)
+        ansatz._build()
+
+        expected = converter.convert_match(ansatz.excitation_ops(), suppress_none=True)
+
+        self.assertEqual(len(ansatz.operators), len(expected))
+        for op, exp in zip(ansatz.operators, expected):
+            self.assertTrue(np.allclose(op.to_matrix(), exp.to_matrix()))
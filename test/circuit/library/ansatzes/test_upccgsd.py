@@ -0,0 +1,53 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the UpCCGSD Ansatz."""
+
+from test import QiskitNatureTestCase
+from test.circuit.library.ansatzes.test_ucc import assert_ucc_like_ansatz
+
+from ddt import ddt, data, unpack
+
+from qiskit_nature.circuit.library.ansatzes import UpCCGSD
+from qiskit_nature.mappers.second_quantization import JordanWignerMapper
+from qiskit_nature.operators.second_quantization import FermionicOp
+from qiskit_nature.operators.second_quantization.qubit_converter import QubitConverter
+
+
+@ddt
+class TestUpCCGSD(QiskitNatureTestCase):
+    """Tests for the UpCCGSD Ansatz."""
+
+    @unpack
+    @data(
+        (4, (1, 1), [FermionicOp([('+-II', 1j), ('-+II', 1j)]),
+                     FermionicOp([('II+-', 1j), ('II-+', 1j)]),
+                     FermionicOp([('+-+-', 1j), ('-+-+', -1j)])]),
+        (6, (1, 1), [FermionicOp([('+-IIII', 1j), ('-+IIII', 1j)]),
+                     FermionicOp([('+I-III', 1j), ('-I+III', 1j)]),
+                     FermionicOp([('I+-III', 1j), ('I-+III', 1j)]),
+                     FermionicOp([('III+-I', 1j), ('III-+I', 1j)]),
+                     FermionicOp([('III+I-', 1j), ('III-I+', 1j)]),
+                     FermionicOp([('IIII+-', 1j), ('IIII-+', 1j)]),
+                     FermionicOp([('+-I+-I', 1j), ('-+I-+I', -1j)]),
+                     FermionicOp([('+I-+I-', 1j), ('-I+-I+', -1j)]),
+                     FermionicOp([('I+-I+-', 1j), ('I-+I-+', -1j)])]),
+    )
+    def test_upccgsd_ansatz(self, num_spin_orbitals, num_particles, expect):
+        """Tests the UpCCGSD Ansatz."""
+        converter = QubitConverter(JordanWignerMapper())
+
+        ansatz = UpCCGSD(qubit_converter=converter,
+                         num_particles=num_particles,
+                         num_spin_orbitals=num_spin_orbitals)
+
+        assert_ucc_like_ansatz(self, ansatz, num_spin_orbitals, expect)
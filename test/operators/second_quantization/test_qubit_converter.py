@@ -14,10 +14,12 @@
 
 import unittest
 from typing import Optional, List
+from unittest.mock import PropertyMock, patch
 
 from test import QiskitNatureTestCase
 
 from qiskit.opflow import X, Y, Z, I, PauliSumOp, Z2Symmetries
+from qiskit.utils import algorithm_globals
 
 from qiskit_nature import QiskitNatureError
 from qiskit_nature.drivers import HDF5Driver
@@ -127,6 +129,21 @@ class TestQubitConverter(QiskitNatureTestCase):
             qubit_op = qubit_conv.convert_match(self.h2_op)
             self.assertEqual(qubit_op, TestQubitConverter.REF_H2_PARITY_2Q_REDUCED)
 
+    def test_convert_match_parallel(self):
+        """ Test the parallel batch dispatch of convert_match against the serial conversion """
+        qubit_conv = QubitConverter(JordanWignerMapper())
+
+        second_q_ops = [self.h2_op, self.h2_op, self.h2_op]
+
+        # lower the threshold and raise the process count so that the parallel branch engages
+        # even on a single-CPU runner
+        with patch.object(QubitConverter, 'PARALLEL_THRESHOLD', 2), \
+                patch.object(type(algorithm_globals), 'num_processes',
+                             new_callable=PropertyMock, return_value=2):
+            qubit_ops = qubit_conv.convert_match(second_q_ops)
+
+        self.assertEqual(qubit_ops, [TestQubitConverter.REF_H2_JW] * 3)
+
     def test_two_qubit_reduction(self):
         """ Test mapping to qubit operator with two qubit reduction """
         mapper = ParityMapper()